@@ -1,4 +1,5 @@
 import os
+import threading
 
 import supervisely as sly
 from dotenv import load_dotenv
@@ -8,6 +9,9 @@ if sly.is_development():
     load_dotenv(os.path.expanduser("~/supervisely.env"))
 
 api: sly.Api = sly.Api.from_env()
+# single attempt per request: retries with backoff are done by the limiters in src/throttling.py
+limited_api: sly.Api = sly.Api.from_env(retry_count=1)
+limited_api.retry_sleep_sec = 0
 
 TEAM_ID = sly.env.team_id()
 WORKSPACE_ID = sly.env.workspace_id()
@@ -16,3 +20,19 @@ STORAGE_DIR = sly.app.get_data_dir()
 USER_PREVIEW_LIMIT = 100
 FILE_SIZE = None
 BATCH_SIZE = 10000
+HEADER_CHUNK_SIZE = 16 * 1024
+HEADER_MAX_SIZE = 256 * 1024
+
+IMPORT_HISTORY_PATH = os.path.join(STORAGE_DIR, "import_history.json")
+# durations of recent imports are kept in Team Files to predict duration in the next sessions
+IMPORT_HISTORY_REMOTE_PATH = "/import-images-in-sly-format-from-cloud-storage/import_history.json"
+IMPORT_HISTORY_SIZE = 10
+DEFAULT_COPY_THROUGHPUT = 20 * 1024 * 1024  # bytes per second
+DEFAULT_LINK_THROUGHPUT = 100  # images per second
+DEFAULT_CHECKED_LINK_THROUGHPUT = 30  # images per second, one header request per image
+
+# etag (or content hash) -> local path of the first downloaded copy, lives for one import job
+DOWNLOAD_CACHE = {}
+# etag -> event set when the download started by another thread is finished
+DOWNLOADS_IN_FLIGHT = {}
+DOWNLOAD_LOCK = threading.Lock()
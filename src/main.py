@@ -1,3 +1,9 @@
+import time
+
+start_time = time.monotonic()
+
+import asyncio
+
 import supervisely as sly
 from supervisely.app.widgets import Container
 
@@ -13,3 +19,25 @@ layout = Container(
 )
 
 app = sly.Application(layout=layout)
+sly.logger.info(f"App layout is ready in {time.monotonic() - start_time:.2f}s")
+
+
+def discover_providers():
+    try:
+        connect_to_bucket.load_providers()
+    except Exception as e:
+        sly.logger.error(f"Couldn't load cloud storage providers: {repr(e)}")
+    finally:
+        connect_to_bucket.card.loading = False
+    sly.logger.info(
+        f"Cloud storage providers are loaded in {time.monotonic() - start_time:.2f}s after start"
+    )
+
+
+async def on_startup():
+    # widget setters push state changes with run_sync in a separate event loop,
+    # so it's safe to update widgets from the executor thread
+    asyncio.get_running_loop().run_in_executor(None, discover_providers)
+
+
+app.get_server().add_event_handler("startup", on_startup)
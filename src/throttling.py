@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+from typing import Callable
+
+import requests
+import supervisely as sly
+from supervisely.io.network_exceptions import RETRY_STATUS_CODES
+
+RETRY_COUNT = 10
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+
+def is_throttling_error(exc: Exception) -> bool:
+    """
+    Calls should be made with `g.limited_api` (single attempt per request). On a retryable
+    status or connection error it gives up at once with RetryError, which has no response.
+    """
+    if isinstance(
+        exc,
+        (
+            requests.exceptions.RetryError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ),
+    ):
+        return True
+    response = getattr(exc, "response", None)
+    return response is not None and response.status_code in RETRY_STATUS_CODES
+
+
+class AdaptiveLimiter:
+    """
+    Limits the number of concurrent calls for one class of endpoints.
+    The limit grows additively after successful calls and is halved when
+    the storage or API responds with throttling errors (AIMD).
+    Throttled calls are retried with jittered exponential backoff.
+    """
+
+    def __init__(self, name: str, initial_limit: int, max_limit: int, min_limit: int = 1):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _set_limit(self, new_limit: float) -> None:
+        with self._condition:
+            old_limit = self.limit
+            self._limit = min(max(new_limit, self.min_limit), self.max_limit)
+            if self.limit != old_limit:
+                sly.logger.info(
+                    f"Concurrency limit for '{self.name}' changed: {old_limit} -> {self.limit}"
+                )
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        self._set_limit(self._limit + 1 / self._limit)
+
+    def on_throttle(self) -> None:
+        self._set_limit(self._limit / 2)
+
+    def call(self, func: Callable, *args, **kwargs):
+        for attempt in range(RETRY_COUNT + 1):
+            self._acquire()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_throttling_error(e) or attempt == RETRY_COUNT:
+                    raise
+                self.on_throttle()
+                delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+                sly.logger.warn(
+                    f"'{self.name}' request is throttled: {repr(e)}. "
+                    f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{RETRY_COUNT})"
+                )
+            else:
+                self.on_success()
+                return result
+            finally:
+                self._release()
+            time.sleep(delay)
+
+
+LISTING = AdaptiveLimiter("listing", initial_limit=4, max_limit=16)
+OBJECT_GET = AdaptiveLimiter("object GET", initial_limit=8, max_limit=32)
+UPLOAD_LINKS = AdaptiveLimiter("upload_links", initial_limit=2, max_limit=8)
+UPLOAD_JSONS = AdaptiveLimiter("upload_jsons", initial_limit=2, max_limit=8)
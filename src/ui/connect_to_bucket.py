@@ -1,41 +1,14 @@
 import os
+from typing import List, Tuple
 
 import supervisely as sly
 from supervisely.app.widgets import Button, Card, Container, Input, Select, Text, NotificationBox
 
 import src.globals as g
+import src.throttling as throttling
 import src.ui.import_settings as import_settings
 import src.ui.preview_bucket_items as preview_bucket_items
 
-try:
-    all_providers_info = g.api.remote_storage.get_list_supported_providers(team_id=g.TEAM_ID)
-except:
-    all_providers_info = []
-all_providers = [provider["defaultProtocol"].rstrip(":") for provider in all_providers_info]
-
-try:
-    providers_info = g.api.remote_storage.get_list_available_providers(team_id=g.TEAM_ID)
-except:
-    providers_info = []
-
-providers = [provider["defaultProtocol"].rstrip(":") for provider in providers_info]
-
-provider_items = []
-disabled_items = []
-disabled_items_names = []
-for provider in all_providers_info:
-    if provider["defaultProtocol"].rstrip(":") in providers:
-        item = Select.Item(value=provider["defaultProtocol"].rstrip(":"), label=provider["name"])
-        provider_items.append(item)
-    else:
-        item = Select.Item(
-            value=provider["defaultProtocol"].rstrip(":"), label=provider["name"], disabled=True
-        )
-        disabled_items.append(item)
-        disabled_items_names.append(item.label)
-
-provider_items.extend(disabled_items)
-
 provider_notification_0 = NotificationBox(
     title="Cloud Storage Connection Required",
     description=(
@@ -47,50 +20,33 @@ provider_notification_0 = NotificationBox(
     ),
     box_type="info",
 )
+provider_notification_0.hide()
 
 provider_notification_1 = NotificationBox(
     title="Сonfigure cloud storage provider in instance settings",
-    description=(
-        "You can set up a new provider in the instance settings. "
-        "To connect a new provider to your instance follow this "
-        "<a href='https://docs.supervisely.com/enterprise-edition/advanced-tuning/s3#links-plugin-cloud-providers-support'>guide</a>. "
-        f"You can connect {', '.join(disabled_items_names)} or any S3 compatible providers. "
-        "If you have any questions, please contact tech support."
-    ),
+    description="",
     box_type="info",
 )
+provider_notification_1.hide()
 
 no_buckets_notification = Text(
     "You don't have any available buckets in this cloud storage", "warning"
 )
 no_buckets_notification.hide()
 
-provider_buckets = {provider["defaultProtocol"].rstrip(":"): [] for provider in providers_info}
-for provider in providers_info:
-    if provider.get("buckets") is not None:
-        provider_buckets[provider["defaultProtocol"].rstrip(":")].extend(
-            [Select.Item(value=bucket, label=bucket) for bucket in provider["buckets"]]
-        )
+provider_buckets = {}
 
 provider_selector = Select(
-    items=provider_items,
+    items=[],
     placeholder="Select provider",
     width_percent=100,
 )
 
-if len(provider_items) == 0:
-    provider_selector.disable()
-
 provider_title = Text("<b>Provider</b>", "text")
 provider = Container([provider_title, provider_selector])
 
-bucket_items = []
-if len(providers) > 0:
-    # bucket_items = provider_buckets[providers[0]]
-    bucket_items = provider_buckets[provider_items[0].value]
-
 bucket_name_selector = Select(
-    items=bucket_items,
+    items=[],
     filterable=True,
     placeholder="Select bucket",
     width_percent=100,
@@ -99,44 +55,105 @@ bucket_name_selector = Select(
 bucket_name_input = Input()
 connect_button = Button(text="Connect", icon="zmdi zmdi-cloud")
 
-if len(provider_items) == 0:
-    provider_selector.disable()
-    bucket_name_selector.disable()
-    connect_button.disable()
+provider_selector.disable()
+bucket_name_selector.disable()
+connect_button.disable()
 
 bucket_name_title = Text("<b>Bucket name</b>", "text")
 bucket_name = Container([bucket_name_title, bucket_name_selector])
 
-if len(provider_items) == 0:
-    card_content = Container(
-        widgets=[
-            provider_notification_0,
-            provider,
-            bucket_name,
-            no_buckets_notification,
-            connect_button,
-        ]
-    )
-elif len(disabled_items) > 0:
-    card_content = Container(
-        widgets=[
-            provider_notification_1,
-            provider,
-            bucket_name,
-            no_buckets_notification,
-            connect_button,
-        ]
-    )
-else:
-    card_content = Container(
-        widgets=[provider, bucket_name, no_buckets_notification, connect_button]
-    )
+card_content = Container(
+    widgets=[
+        provider_notification_0,
+        provider_notification_1,
+        provider,
+        bucket_name,
+        no_buckets_notification,
+        connect_button,
+    ]
+)
 
 card = Card(
     title="1️⃣ Connect to the cloud storage",
     description="Choose cloud service provider and bucket name",
     content=card_content,
 )
+card.loading = True
+
+
+def get_providers_info() -> Tuple[List[dict], List[dict]]:
+    """
+    Returns supported and available (connected to the instance) providers.
+    """
+    try:
+        all_providers_info = g.api.remote_storage.get_list_supported_providers(team_id=g.TEAM_ID)
+    except:
+        all_providers_info = []
+
+    try:
+        providers_info = g.api.remote_storage.get_list_available_providers(team_id=g.TEAM_ID)
+    except:
+        providers_info = []
+    return all_providers_info, providers_info
+
+
+def load_providers() -> None:
+    """
+    Fills provider and bucket selectors. Called in background after the app has started,
+    so the layout is served without waiting for provider discovery.
+    """
+    all_providers_info, providers_info = get_providers_info()
+    providers = [provider["defaultProtocol"].rstrip(":") for provider in providers_info]
+
+    provider_items = []
+    disabled_items = []
+    disabled_items_names = []
+    for provider in all_providers_info:
+        if provider["defaultProtocol"].rstrip(":") in providers:
+            item = Select.Item(
+                value=provider["defaultProtocol"].rstrip(":"), label=provider["name"]
+            )
+            provider_items.append(item)
+        else:
+            item = Select.Item(
+                value=provider["defaultProtocol"].rstrip(":"), label=provider["name"], disabled=True
+            )
+            disabled_items.append(item)
+            disabled_items_names.append(item.label)
+
+    provider_items.extend(disabled_items)
+
+    for provider in providers_info:
+        provider_buckets[provider["defaultProtocol"].rstrip(":")] = [
+            Select.Item(value=bucket, label=bucket) for bucket in provider.get("buckets") or []
+        ]
+
+    provider_selector.set(items=provider_items)
+    if len(provider_items) == 0:
+        provider_notification_0.show()
+        return
+
+    provider_selector.set_value(provider_items[0].value)
+
+    if len(disabled_items) > 0:
+        provider_notification_1.set(
+            title="Сonfigure cloud storage provider in instance settings",
+            description=(
+                "You can set up a new provider in the instance settings. "
+                "To connect a new provider to your instance follow this "
+                "<a href='https://docs.supervisely.com/enterprise-edition/advanced-tuning/s3#links-plugin-cloud-providers-support'>guide</a>. "
+                f"You can connect {', '.join(disabled_items_names)} or any S3 compatible providers. "
+                "If you have any questions, please contact tech support."
+            ),
+        )
+        provider_notification_1.show()
+
+    if len(providers) > 0:
+        bucket_name_selector.set(items=provider_buckets[provider_items[0].value])
+
+    provider_selector.enable()
+    bucket_name_selector.enable()
+    connect_button.enable()
 
 
 @provider_selector.value_changed
@@ -164,7 +181,13 @@ def preview_items():
 
     path = f"{provider}://{bucket_name}"
     try:
-        files = g.api.remote_storage.list(path, recursive=False, limit=g.USER_PREVIEW_LIMIT + 1, team_id=g.TEAM_ID)
+        files = throttling.LISTING.call(
+            g.limited_api.remote_storage.list,
+            path,
+            recursive=False,
+            limit=g.USER_PREVIEW_LIMIT + 1,
+            team_id=g.TEAM_ID,
+        )
     except Exception as e:
         sly.logger.warn(repr(e))
         raise sly.app.DialogWindowWarning(
@@ -196,7 +219,13 @@ def refresh_tree_viewer(current_path):
 
     path = f"{provider}://{new_path.strip('/')}"
     try:
-        files = g.api.remote_storage.list(path, recursive=False, limit=g.USER_PREVIEW_LIMIT + 1, team_id=g.TEAM_ID)
+        files = throttling.LISTING.call(
+            g.limited_api.remote_storage.list,
+            path,
+            recursive=False,
+            limit=g.USER_PREVIEW_LIMIT + 1,
+            team_id=g.TEAM_ID,
+        )
     except Exception as e:
         sly.logger.warn(repr(e))
         raise sly.app.DialogWindowWarning(
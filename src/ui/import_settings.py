@@ -1,6 +1,9 @@
+import time
+
 from supervisely.app.widgets import (
     Button,
     Card,
+    Checkbox,
     Container,
     Progress,
     SelectWorkspace,
@@ -9,6 +12,7 @@ from supervisely.app.widgets import (
     RadioGroup,
     ReloadableArea,
     Empty,
+    Flexbox,
 )
 
 import src.globals as g
@@ -32,8 +36,24 @@ data_duplication_field = Field(
     title="Data duplication", description="", content=duplication_options
 )
 
+check_headers_checkbox = Checkbox(
+    content="Check image headers and skip corrupted images before adding them by link"
+)
+check_headers_field = Field(
+    title="Image validation",
+    description=(
+        "Only the first kilobytes of every image are read from the cloud storage. "
+        "Corrupted images are skipped together with their annotations. Images that can't be "
+        "checked this way (e.g. unsupported format) are added as usual."
+    ),
+    content=check_headers_checkbox,
+)
+check_headers_field.hide()
+
 destination = SelectWorkspace(default_id=g.WORKSPACE_ID, team_id=g.TEAM_ID)
 import_button = Button(text="Start")
+estimate_button = Button(text="Estimate", button_type="info", plain=True, icon="zmdi zmdi-time")
+buttons = Flexbox(widgets=[import_button, estimate_button])
 
 progress_bar = Progress()
 progress_bar.hide()
@@ -51,8 +71,9 @@ results_widgets.hide()
 destination_container = Container(
     widgets=[
         data_duplication_field,
+        check_headers_field,
         destination,
-        import_button,
+        buttons,
         progress_bar,
         progress_bar2,
         output_message,
@@ -71,6 +92,14 @@ card = Card(
 card.hide()
 
 
+@duplication_options.value_changed
+def on_duplication_option_changed(value):
+    if value == "link":
+        check_headers_field.show()
+    else:
+        check_headers_field.hide()
+
+
 @import_button.click
 def import_images_project():
     progress_bar.hide()
@@ -79,6 +108,9 @@ def import_images_project():
     results_widgets.hide()
     dst_projects_ids = []
     result_preview_widgets = []
+    skipped_images = []
+    g.DOWNLOAD_CACHE = {}
+    g.DOWNLOADS_IN_FLIGHT = {}
 
     selected_dirs = [dir["path"] for dir in preview_bucket_items.file_viewer.get_selected_items()]
     provider = connect_to_bucket.provider_selector.get_value()
@@ -87,12 +119,18 @@ def import_images_project():
     dst_ws_id = destination.get_selected_id()
     dst_ws_name = g.api.workspace.get_info_by_id(dst_ws_id).name
 
+    mode = duplication_options.get_value()
+    check_headers = mode == "link" and check_headers_checkbox.is_checked()
+    # listing during validation takes a large part of the import, so it's measured too
+    start_time = time.monotonic()
     progress_bar.show()
-    validated_map = utils.validate_selected_dirs(selected_dirs, provider, bucket_name, progress_bar)
+    validated_map = utils.validate_selected_dirs(
+        selected_dirs, provider, bucket_name, progress_bar, collect_keys=mode == "copy"
+    )
     validated_dirs = list(validated_map.keys())
 
     if len(validated_map) > 0:
-        if duplication_options.get_value() == "copy":
+        if mode == "copy":
             project_dirs = utils.download_selected_projects(
                 validated_dirs, validated_map, progress_bar, progress_bar2
             )
@@ -101,9 +139,25 @@ def import_images_project():
             )
         else:
             dst_projects_ids = utils.upload_projects_by_links(
-                validated_dirs, validated_map, dst_ws_id, progress_bar, progress_bar2
+                validated_dirs,
+                validated_map,
+                dst_ws_id,
+                progress_bar,
+                progress_bar2,
+                check_headers,
+                skipped_images,
             )
 
+    if len(dst_projects_ids) > 0:
+        stats = utils.get_import_stats(validated_map)
+        utils.save_import_run(
+            mode,
+            sum(project_stats["images"] for project_stats in stats),
+            sum(project_stats["size"] for project_stats in stats),
+            time.monotonic() - start_time,
+            check_headers,
+        )
+
     skipped_projects_count = len(selected_dirs) - len(validated_dirs)
     utils.show_result(
         dst_ws_name,
@@ -113,4 +167,30 @@ def import_images_project():
         result_preview_widgets,
         results_widgets,
         skipped_projects_count,
+        len(skipped_images),
+    )
+
+
+@estimate_button.click
+def estimate_import():
+    progress_bar.hide()
+    progress_bar2.hide()
+    output_message.hide()
+    results_widgets.hide()
+
+    selected_dirs = [dir["path"] for dir in preview_bucket_items.file_viewer.get_selected_items()]
+    provider = connect_to_bucket.provider_selector.get_value()
+    bucket_name = connect_to_bucket.bucket_name_selector.get_value()
+
+    progress_bar.show()
+    skipped = []
+    validated_map = utils.validate_selected_dirs(
+        selected_dirs, provider, bucket_name, progress_bar, skipped
+    )
+    progress_bar.hide()
+    utils.show_estimate(
+        utils.get_import_stats(validated_map),
+        skipped,
+        output_message,
+        check_headers_checkbox.is_checked(),
     )
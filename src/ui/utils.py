@@ -1,12 +1,28 @@
 import os
-from typing import List
+import shutil
+import struct
+import threading
+import warnings
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 import supervisely as sly
-from supervisely import ProjectInfo, batched, Project
+from PIL import Image, ImageFile
+from supervisely import ProjectInfo, batched, batched_iter, Project
+from supervisely._utils import sizeof_fmt
+from supervisely.api.module_api import ApiField
 
 import src.globals as g
+import src.throttling as throttling
 
 from supervisely.io.json import load_json_file, dump_json_file
-from supervisely.io.fs import silent_remove, remove_dir, mkdir
+from supervisely.io.fs import (
+    get_file_ext,
+    get_file_hash_chunked,
+    silent_remove,
+    remove_dir,
+    mkdir,
+)
 from supervisely.app.widgets import (
     Container,
     Flexbox,
@@ -16,9 +32,17 @@ from supervisely.app.widgets import (
     Progress,
 )
 
+# only headers of large images are parsed here, pixel data is never decoded
+warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+
 
 def validate_selected_dirs(
-    selected_dirs: List[str], provider: str, bucket_name: str, progress_bar: Progress
+    selected_dirs: List[str],
+    provider: str,
+    bucket_name: str,
+    progress_bar: Progress,
+    skipped: Optional[List[dict]] = None,
+    collect_keys: bool = False,
 ) -> dict:
     """
     Returns dict with validated dirs in format:
@@ -29,13 +53,24 @@ def validate_selected_dirs(
                 "datasets": [
                     {
                         "dataset_name": dataset_name
-                        "images": {"names": names, "links": links}
-                        "annotations": {"names": names, "links": links}
+                        "size": size of images and annotations in bytes
+                        "images": {"prefix": prefix, "names": names, "etags": etags, "sizes": sizes}
+                        "annotations": {"prefix": prefix, "names": names}
                     }
                 ]
             }
         }
+    Links are not stored, use `get_links` to build them from the folder prefix when needed.
+    Etags and sizes for deduplication are collected only if `collect_keys` is True (copy mode).
+    Skipped projects and datasets are appended to `skipped` as {"path": path, "reason": reason}.
     """
+    if skipped is None:
+        skipped = []
+
+    def _skip(path: str, reason: str) -> None:
+        sly.logger.warn(f"{reason}. Skipping...")
+        skipped.append({"path": path, "reason": reason})
+
     validated_map = {dir: {} for dir in selected_dirs}
     with progress_bar(message="Validating selected directories", total=len(selected_dirs)) as pbar:
         for dir in selected_dirs:
@@ -43,9 +78,11 @@ def validate_selected_dirs(
             validated_map[dir]["project_name"] = project_name
 
             remote_project_dir = f"{provider}://{dir.lstrip('/')}"
-            project_files = g.api.remote_storage.list(remote_project_dir, False, team_id=g.TEAM_ID)
+            project_files = throttling.LISTING.call(
+                g.limited_api.remote_storage.list, remote_project_dir, False, team_id=g.TEAM_ID
+            )
             if len(project_files) == 0:
-                sly.logger.warn(f"Project directory'{remote_project_dir}' is empty. Skipping...")
+                _skip(remote_project_dir, f"Project directory '{remote_project_dir}' is empty")
                 validated_map.pop(dir)
                 pbar.update()
                 continue
@@ -53,7 +90,7 @@ def validate_selected_dirs(
                 f for f in project_files if f["name"] == "meta.json" and f["type"] == "file"
             ]
             if len(remote_meta_path) == 0:
-                sly.logger.warn(f"'meta.json' file not found in {remote_project_dir}. Skipping...")
+                _skip(remote_project_dir, f"'meta.json' file not found in {remote_project_dir}")
                 validated_map.pop(dir)
                 pbar.update()
                 continue
@@ -61,10 +98,11 @@ def validate_selected_dirs(
             remote_meta_path = f"{provider}://{bucket_name}/{remote_meta_path[0]['prefix']}/{remote_meta_path[0]['name']}"
             try:
                 local_meta_path = os.path.join(g.STORAGE_DIR, dir.lstrip("/"), "meta.json")
-                g.api.remote_storage.download_path(remote_meta_path, local_meta_path, team_id=g.TEAM_ID)
+                download_object(remote_meta_path, local_meta_path)
             except:
-                sly.logger.warn(
-                    f"Couldn't download 'meta.json' file from '{remote_meta_path}'. Skipping..."
+                _skip(
+                    remote_project_dir,
+                    f"Couldn't download 'meta.json' file from '{remote_meta_path}'",
                 )
                 validated_map.pop(dir)
                 pbar.update()
@@ -76,11 +114,12 @@ def validate_selected_dirs(
                 validated_map[dir]["project_meta"] = meta
                 silent_remove(local_meta_path)
             except:
-                sly.logger.warn(
+                _skip(
+                    remote_project_dir,
                     (
                         f"There's something wrong with 'meta.json' file from '{remote_meta_path}'. "
-                        "Please, check if it's in valid project meta format. Skipping..."
-                    )
+                        "Please, check if it's in valid project meta format"
+                    ),
                 )
                 validated_map.pop(dir)
                 pbar.update()
@@ -88,9 +127,7 @@ def validate_selected_dirs(
 
             datasets = [f for f in project_files if f["type"] == "folder"]
             if len(datasets) == 0:
-                sly.logger.warn(
-                    f"No datasets found in project: '{remote_project_dir}'. Skipping..."
-                )
+                _skip(remote_project_dir, f"No datasets found in project: '{remote_project_dir}'")
                 validated_map.pop(dir)
                 pbar.update()
                 continue
@@ -103,81 +140,128 @@ def validate_selected_dirs(
                 )
                 dataset_folders = [
                     file
-                    for file in g.api.remote_storage.list(remote_dataset_path, False, False, True, team_id=g.TEAM_ID)
+                    for file in throttling.LISTING.call(
+                        g.limited_api.remote_storage.list,
+                        remote_dataset_path,
+                        False,
+                        False,
+                        True,
+                        team_id=g.TEAM_ID,
+                    )
                     if file["name"] in ["img", "ann"]
                 ]
                 if len(dataset_folders) != 2:
-                    sly.logger.warn(
+                    _skip(
+                        remote_dataset_path,
                         (
                             f"Dataset '{remote_dataset_path}' is not valid. "
-                            "Dataset dir must contain folders 'img' and 'ann'. Skipping..."
-                        )
+                            "Dataset dir must contain folders 'img' and 'ann'"
+                        ),
                     )
                     continue
 
-                image_links = []
+                dataset_size = 0
+                image_prefix = None
                 image_names = []
+                image_etags = []
+                image_sizes = array("Q")
+                annotation_prefix = None
                 annotation_names = []
-                annotation_links = []
                 for ds_folder in dataset_folders:
                     base_dir = ds_folder["name"]
                     remote_base_dir_path = (
                         f"{provider}://{bucket_name}/{ds_folder['prefix']}/{ds_folder['name']}"
                     )
                     if base_dir == "img":
-                        image_files = g.api.remote_storage.list(
-                            remote_base_dir_path, False, True, False, team_id=g.TEAM_ID
+                        image_files = throttling.LISTING.call(
+                            g.limited_api.remote_storage.list,
+                            remote_base_dir_path,
+                            False,
+                            True,
+                            False,
+                            team_id=g.TEAM_ID,
                         )
-                        if len(image_files) == 0:
-                            sly.logger.warn(
-                                f"No images found in dataset: '{remote_dataset_path}'. Skipping..."
-                            )
-                            break
+                        image_prefix = remote_base_dir_path
                         image_names.extend([file["name"] for file in image_files])
-                        image_links.extend(
-                            [
-                                f"{provider}://{bucket_name}/{file['prefix']}/{file['name']}"
-                                for file in image_files
-                            ]
-                        )
+                        if collect_keys:
+                            image_etags.extend([get_etag(file) for file in image_files])
+                            image_sizes.extend([file["size"] for file in image_files])
+                        dataset_size += sum(file["size"] for file in image_files)
                     if base_dir == "ann":
-                        annotation_files = g.api.remote_storage.list(
-                            remote_base_dir_path, False, True, False, team_id=g.TEAM_ID
+                        annotation_files = throttling.LISTING.call(
+                            g.limited_api.remote_storage.list,
+                            remote_base_dir_path,
+                            False,
+                            True,
+                            False,
+                            team_id=g.TEAM_ID,
                         )
-                        if len(annotation_files) == 0:
-                            sly.logger.warn(
-                                f"No annotations found in dataset: '{remote_dataset_path}'. Skipping..."
-                            )
-                            continue
+                        annotation_prefix = remote_base_dir_path
                         annotation_names.extend([file["name"] for file in annotation_files])
-                        annotation_links.extend(
-                            [
-                                f"{provider}://{bucket_name}/{file['prefix']}/{file['name']}"
-                                for file in annotation_files
-                            ]
-                        )
+                        dataset_size += sum(file["size"] for file in annotation_files)
+                if len(image_names) == 0:
+                    _skip(
+                        remote_dataset_path, f"No images found in dataset: '{remote_dataset_path}'"
+                    )
+                    continue
+                if len(annotation_names) == 0:
+                    _skip(
+                        remote_dataset_path,
+                        f"No annotations found in dataset: '{remote_dataset_path}'",
+                    )
+                    continue
                 if len(image_names) != len(annotation_names):
-                    sly.logger.warn(
+                    _skip(
+                        remote_dataset_path,
                         (
                             f"Number of images and annotations in dataset '{remote_dataset_path}' "
-                            "is not equal. Skipping..."
-                        )
+                            "is not equal"
+                        ),
                     )
                     continue
 
+                dataset_images = {"prefix": image_prefix, "names": image_names}
+                if collect_keys:
+                    dataset_images["etags"] = image_etags
+                    dataset_images["sizes"] = image_sizes
                 validated_map[dir]["datasets"].append(
                     {
                         "dataset_name": dataset_name,
-                        "images": {"names": image_names, "links": image_links},
-                        "annotations": {"names": annotation_names, "links": annotation_links},
+                        "size": dataset_size,
+                        "images": dataset_images,
+                        "annotations": {"prefix": annotation_prefix, "names": annotation_names},
                     },
                 )
             if len(validated_map[dir]["datasets"]) == 0:
+                _skip(
+                    remote_project_dir,
+                    f"No valid datasets found in project: '{remote_project_dir}'",
+                )
                 validated_map.pop(dir)
             pbar.update()
         return validated_map
 
 
+def get_links(items: dict, names: Optional[List[str]] = None) -> Iterator[str]:
+    """
+    Lazily builds full remote links for the given names (all names by default)
+    from the folder prefix of the images or annotations map.
+    """
+    if names is None:
+        names = items["names"]
+    return (f"{items['prefix']}/{name}" for name in names)
+
+
+def select_items(items: dict, idxs: List[int]) -> dict:
+    """
+    Returns images or annotations map with only the items at the given indexes.
+    """
+    return {
+        key: value if key == "prefix" else [value[idx] for idx in idxs]
+        for key, value in items.items()
+    }
+
+
 def download_selected_projects(
     selected_dirs: str, validated_map: dict, progress_bar: Progress, progress_bar2: Progress
 ) -> List[str]:
@@ -208,17 +292,33 @@ def download_selected_projects(
 
                 dataset_images = dataset_map["images"]
                 dataset_annotations = dataset_map["annotations"]
+                if not all(dataset_images["etags"]):
+                    sly.logger.info(
+                        f"Cloud storage didn't return etags for images of dataset '{dataset_name}'. "
+                        "Duplicated images will be detected by content hash after download"
+                    )
 
                 with progress_bar2(
                     message=f"Downloading images for dataset: '{dataset_name}'",
                     total=len(dataset_images["names"]),
                 ) as pbar2:
                     progress_bar2.show()
-                    for image_name, image_link in zip(
-                        dataset_images["names"], dataset_images["links"]
-                    ):
+
+                    def _download_image(item):
+                        image_name, image_link, image_etag, image_size = item
                         local_img_path = os.path.join(dataset_img_path, image_name)
-                        g.api.remote_storage.download_path(image_link, local_img_path, team_id=g.TEAM_ID)
+                        download_blob(image_link, local_img_path, image_etag, image_size)
+
+                    for _ in run_concurrently(
+                        _download_image,
+                        zip(
+                            dataset_images["names"],
+                            get_links(dataset_images),
+                            dataset_images["etags"],
+                            dataset_images["sizes"],
+                        ),
+                        throttling.OBJECT_GET.max_limit,
+                    ):
                         pbar2.update()
                     progress_bar2.hide()
 
@@ -227,11 +327,17 @@ def download_selected_projects(
                     total=len(dataset_annotations["names"]),
                 ) as pbar2:
                     progress_bar2.show()
-                    for ann_name, ann_link in zip(
-                        dataset_annotations["names"], dataset_annotations["links"]
-                    ):
+
+                    def _download_ann(item):
+                        ann_name, ann_link = item
                         local_ann_path = os.path.join(dataset_ann_path, ann_name)
-                        g.api.remote_storage.download_path(ann_link, local_ann_path, team_id=g.TEAM_ID)
+                        download_object(ann_link, local_ann_path)
+
+                    for _ in run_concurrently(
+                        _download_ann,
+                        zip(dataset_annotations["names"], get_links(dataset_annotations)),
+                        throttling.OBJECT_GET.max_limit,
+                    ):
                         pbar2.update()
                     progress_bar2.hide()
 
@@ -240,6 +346,88 @@ def download_selected_projects(
         return project_dirs
 
 
+def run_concurrently(func: Callable, items: Iterable, max_workers: int) -> Iterator:
+    """
+    Calls func for every item in a thread pool, yields results in the order of items.
+    Items are submitted in windows of BATCH_SIZE, so lazy items (e.g. links) are built
+    only for the current window.
+    Actual concurrency of remote calls is controlled by the limiters in `src.throttling`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for window in batched_iter(items, g.BATCH_SIZE):
+            yield from executor.map(func, window)
+
+
+def download_object(remote_path: str, local_path: str) -> None:
+    throttling.OBJECT_GET.call(
+        g.limited_api.remote_storage.download_path, remote_path, local_path, team_id=g.TEAM_ID
+    )
+
+
+def get_etag(file: dict) -> Optional[str]:
+    """
+    Returns etag of the object from the listing, or None if the provider didn't return it.
+    """
+    etag = file.get("etag")
+    if not etag:
+        return None
+    return etag.strip('"')
+
+
+def link_local_copy(src_path: str, dst_path: str) -> None:
+    silent_remove(dst_path)
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
+
+
+def download_blob(
+    remote_path: str, local_path: str, etag: Optional[str] = None, size: Optional[int] = None
+) -> None:
+    """
+    Downloads object from cloud storage once per job: if an object with the same etag and size
+    has already been downloaded, the local copy is reused instead.
+    Without etag the object is always downloaded, copies with the same content hash are only
+    hard-linked on disk (upload deduplicates them by hash anyway).
+    """
+    if etag is not None:
+        with g.DOWNLOAD_LOCK:
+            in_flight = g.DOWNLOADS_IN_FLIGHT.get(etag)
+            is_owner = in_flight is None and etag not in g.DOWNLOAD_CACHE
+            if is_owner:
+                g.DOWNLOADS_IN_FLIGHT[etag] = threading.Event()
+        if in_flight is not None:
+            in_flight.wait()
+
+        cached_path = g.DOWNLOAD_CACHE.get(etag)
+        if (
+            cached_path is not None
+            and os.path.isfile(cached_path)
+            and os.path.getsize(cached_path) == size
+        ):
+            link_local_copy(cached_path, local_path)
+            sly.logger.debug(f"Reused already downloaded copy of '{remote_path}'")
+            return
+
+        try:
+            download_object(remote_path, local_path)
+            g.DOWNLOAD_CACHE.setdefault(etag, local_path)
+        finally:
+            if is_owner:
+                with g.DOWNLOAD_LOCK:
+                    g.DOWNLOADS_IN_FLIGHT.pop(etag).set()
+        return
+
+    download_object(remote_path, local_path)
+
+    hash_key = f"hash:{get_file_hash_chunked(local_path)}"
+    cached_path = g.DOWNLOAD_CACHE.setdefault(hash_key, local_path)
+    if cached_path != local_path and os.path.isfile(cached_path):
+        link_local_copy(cached_path, local_path)
+        sly.logger.debug(f"'{remote_path}' has the same content as '{cached_path}'")
+
+
 def upload_projects_by_path(
     project_dirs: List[str], dst_ws_id: int, progress_bar: Progress, progress_bar2: Progress
 ) -> List[int]:
@@ -269,13 +457,96 @@ def upload_projects_by_path(
     return dst_projects_ids
 
 
+class CorruptedImageError(Exception):
+    pass
+
+
+def check_image_header(remote_path: str) -> bool:
+    """
+    Reads only the beginning of the remote image until its header is parsed.
+    Returns True if the header is valid, or False if it couldn't be checked: the format
+    is not supported by PIL, the header is not in the first HEADER_MAX_SIZE bytes
+    or the image is too large for the PIL pixel limit.
+    Raises CorruptedImageError if the image is broken.
+    """
+    json_body = {ApiField.LINK: remote_path, ApiField.GROUP_ID: g.TEAM_ID}
+    response = g.limited_api.post("remote-storage.download", json_body, stream=True)
+    parser = ImageFile.Parser()
+    received = 0
+    stream_ended = True
+    try:
+        for chunk in response.iter_content(chunk_size=g.HEADER_CHUNK_SIZE):
+            try:
+                parser.feed(chunk)
+            except Image.DecompressionBombError:
+                return False
+            except (OSError, SyntaxError, struct.error) as e:
+                raise CorruptedImageError(repr(e)) from e
+            received += len(chunk)
+            if parser.image is not None or received >= g.HEADER_MAX_SIZE:
+                stream_ended = False
+                break
+    finally:
+        response.close()
+
+    if parser.image is None:
+        ext = get_file_ext(remote_path).lower()
+        if not stream_ended or ext not in Image.registered_extensions():
+            return False
+        raise CorruptedImageError(f"Whole file ({received} bytes) can't be parsed as '{ext}' image")
+    width, height = parser.image.size
+    if width <= 0 or height <= 0:
+        raise CorruptedImageError(f"Invalid image size: {width}x{height}")
+    return True
+
+
+def check_image_headers(image_links: Iterator[str], pbar) -> Tuple[List[int], List[int]]:
+    """
+    Reads image headers concurrently.
+    Returns indexes of corrupted images and of images that couldn't be checked
+    (unsupported format, header too far from the beginning or request failed).
+    """
+
+    def _check(item):
+        idx, image_link = item
+        try:
+            checked = throttling.OBJECT_GET.call(check_image_header, image_link)
+            return idx, checked, False
+        except CorruptedImageError as e:
+            sly.logger.warn(f"Image '{image_link}' is corrupted: {e}")
+            return idx, False, True
+        except Exception as e:
+            sly.logger.warn(f"Couldn't read header of image '{image_link}': {repr(e)}")
+            return idx, False, False
+
+    corrupted_idxs = []
+    unchecked_idxs = []
+    for idx, checked, corrupted in run_concurrently(
+        _check, enumerate(image_links), throttling.OBJECT_GET.max_limit
+    ):
+        if corrupted:
+            corrupted_idxs.append(idx)
+        elif not checked:
+            unchecked_idxs.append(idx)
+        pbar.update()
+    return corrupted_idxs, unchecked_idxs
+
+
 def upload_projects_by_links(
     selected_dirs: str,
     validated_map: dict,
     dst_ws_id: int,
     progress_bar: Progress,
     progress_bar2: Progress,
+    check_headers: bool = False,
+    skipped_images: Optional[List[str]] = None,
 ) -> List[ProjectInfo]:
+    """
+    If `check_headers` is True, corrupted images are skipped with their annotations
+    and their links are appended to `skipped_images`.
+    """
+    if skipped_images is None:
+        skipped_images = []
     dst_projects_ids = []
     with progress_bar(
         message="Uploading projects to Supervisely", total=len(selected_dirs)
@@ -293,6 +564,39 @@ def upload_projects_by_links(
                 dataset_name = dataset_map["dataset_name"]
                 dataset_images = dataset_map["images"]
                 dataset_annotations = dataset_map["annotations"]
+                if check_headers:
+                    with progress_bar2(
+                        message=f"Checking image headers for dataset: '{dataset_name}'",
+                        total=len(dataset_images["names"]),
+                    ) as pbar2:
+                        progress_bar2.show()
+                        corrupted_idxs, unchecked_idxs = check_image_headers(
+                            get_links(dataset_images), pbar2
+                        )
+                        progress_bar2.hide()
+                    if len(unchecked_idxs) > 0:
+                        sly.logger.info(
+                            f"{len(unchecked_idxs)} images in dataset '{dataset_name}' couldn't be "
+                            "checked by header, they will be added as usual"
+                        )
+                    if len(corrupted_idxs) > 0:
+                        sly.logger.warn(
+                            f"{len(corrupted_idxs)} corrupted images and their "
+                            f"annotations will be skipped in dataset: '{dataset_name}'"
+                        )
+                        corrupted_names = [dataset_images["names"][idx] for idx in corrupted_idxs]
+                        skipped_images.extend(get_links(dataset_images, corrupted_names))
+                    corrupted_idxs = set(corrupted_idxs)
+                    valid_idxs = [
+                        idx
+                        for idx in range(len(dataset_images["names"]))
+                        if idx not in corrupted_idxs
+                    ]
+                    dataset_images = select_items(dataset_images, valid_idxs)
+                    dataset_annotations = select_items(dataset_annotations, valid_idxs)
+                    if len(valid_idxs) == 0:
+                        continue
+
                 dst_dataset = g.api.dataset.create(
                     dst_project.id, dataset_name, change_name_if_conflict=True
                 )
@@ -303,11 +607,12 @@ def upload_projects_by_links(
                 ) as pbar2:
                     progress_bar2.show()
                     dst_images_ids = []
-                    for batch_images_names, batch_images_links in zip(
-                        batched(dataset_images["names"]), batched(dataset_images["links"])
-                    ):
-                        dst_images = g.api.image.upload_links(
-                            dst_dataset.id, batch_images_names, batch_images_links
+                    for batch_images_names in batched(dataset_images["names"]):
+                        dst_images = throttling.UPLOAD_LINKS.call(
+                            g.limited_api.image.upload_links,
+                            dst_dataset.id,
+                            batch_images_names,
+                            list(get_links(dataset_images, batch_images_names)),
                         )
                         dst_images_ids.extend([image_info.id for image_info in dst_images])
                         pbar2.update(len(batch_images_names))
@@ -320,17 +625,28 @@ def upload_projects_by_links(
                     total=len(dataset_annotations["names"]),
                 ) as pbar2:
                     progress_bar2.show()
-                    for batch_images_ids, batch_ann_names, batch_ann_links in zip(
-                        batched(dst_images_ids),
-                        batched(dataset_annotations["names"]),
-                        batched(dataset_annotations["links"]),
+                    for batch_images_ids, batch_ann_names in zip(
+                        batched(dst_images_ids), batched(dataset_annotations["names"])
                     ):
-                        ann_jsons = []
-                        for ann_name, ann_link in zip(batch_ann_names, batch_ann_links):
+
+                        def _download_ann(item):
+                            ann_name, ann_link = item
                             local_ann_path = os.path.join(local_ann_dir, ann_name)
-                            g.api.remote_storage.download_path(ann_link, local_ann_path, team_id=g.TEAM_ID)
-                            ann_jsons.append(load_json_file(local_ann_path))
-                        g.api.annotation.upload_jsons(batch_images_ids, ann_jsons)
+                            download_object(ann_link, local_ann_path)
+                            return load_json_file(local_ann_path)
+
+                        ann_jsons = list(
+                            run_concurrently(
+                                _download_ann,
+                                zip(
+                                    batch_ann_names, get_links(dataset_annotations, batch_ann_names)
+                                ),
+                                throttling.OBJECT_GET.max_limit,
+                            )
+                        )
+                        throttling.UPLOAD_JSONS.call(
+                            g.limited_api.annotation.upload_jsons, batch_images_ids, ann_jsons
+                        )
                         pbar2.update(len(batch_ann_names))
                     remove_dir(local_ann_dir)
                     progress_bar2.hide()
@@ -347,7 +663,8 @@ def list_objects(full_dir_path: str):
     start_after = None
     last_obj = None
     while True:
-        remote_objs = g.api.remote_storage.list(
+        remote_objs = throttling.LISTING.call(
+            g.limited_api.remote_storage.list,
             path=full_dir_path,
             files=True,
             folders=False,
@@ -365,6 +682,153 @@ def list_objects(full_dir_path: str):
         yield from remote_objs
 
 
+def get_import_stats(validated_map: dict) -> List[dict]:
+    """
+    Returns number of datasets, images and total size in bytes for every validated project.
+    """
+    stats = []
+    for project_map in validated_map.values():
+        dataset_maps = project_map["datasets"]
+        stats.append(
+            {
+                "project_name": project_map["project_name"],
+                "datasets": len(dataset_maps),
+                "images": sum(len(dataset_map["images"]["names"]) for dataset_map in dataset_maps),
+                "size": sum(dataset_map["size"] for dataset_map in dataset_maps),
+            }
+        )
+    return stats
+
+
+def load_import_history() -> List[dict]:
+    """
+    Returns durations of recent imports stored in Team Files, so they are kept between sessions.
+    """
+    try:
+        if not g.api.file.exists(g.TEAM_ID, g.IMPORT_HISTORY_REMOTE_PATH):
+            return []
+        g.api.file.download(g.TEAM_ID, g.IMPORT_HISTORY_REMOTE_PATH, g.IMPORT_HISTORY_PATH)
+        return load_json_file(g.IMPORT_HISTORY_PATH)
+    except Exception as e:
+        sly.logger.warn(f"Couldn't read import history: {repr(e)}")
+        return []
+
+
+def save_import_run(
+    mode: str, images: int, size: int, seconds: float, check_headers: bool = False
+) -> None:
+    """
+    Saves measured duration of the import, used to predict duration of the next imports.
+    """
+    history = load_import_history()
+    history.append(
+        {
+            "mode": mode,
+            "check_headers": check_headers,
+            "images": images,
+            "size": size,
+            "seconds": seconds,
+        }
+    )
+    dump_json_file(history[-g.IMPORT_HISTORY_SIZE :], g.IMPORT_HISTORY_PATH)
+    try:
+        if g.api.file.exists(g.TEAM_ID, g.IMPORT_HISTORY_REMOTE_PATH):
+            g.api.file.remove_file(g.TEAM_ID, g.IMPORT_HISTORY_REMOTE_PATH)
+        g.api.file.upload(g.TEAM_ID, g.IMPORT_HISTORY_PATH, g.IMPORT_HISTORY_REMOTE_PATH)
+    except Exception as e:
+        sly.logger.warn(f"Couldn't save import history: {repr(e)}")
+
+
+def predict_duration(
+    history: List[dict], mode: str, images: int, size: int, check_headers: bool = False
+) -> Tuple[float, bool]:
+    """
+    Predicts import duration in seconds from the throughput of recent runs in the same mode
+    and with the same image validation setting.
+    Copy mode is limited by bytes per second, link mode by images per second.
+    Returns duration and flag whether default throughput was used (no recent runs).
+    """
+    if mode == "copy":
+        key, throughput = "size", g.DEFAULT_COPY_THROUGHPUT
+    elif check_headers:
+        key, throughput = "images", g.DEFAULT_CHECKED_LINK_THROUGHPUT
+    else:
+        key, throughput = "images", g.DEFAULT_LINK_THROUGHPUT
+    runs = [
+        run
+        for run in history
+        if run["mode"] == mode and run.get("check_headers", False) == check_headers
+    ]
+    total_seconds = sum(run["seconds"] for run in runs)
+    total_amount = sum(run[key] for run in runs)
+    is_default = total_seconds <= 0 or total_amount <= 0
+    if not is_default:
+        throughput = total_amount / total_seconds
+    amount = size if mode == "copy" else images
+    return amount / throughput, is_default
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    if minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+def show_estimate(
+    stats: List[dict], skipped: List[dict], output_message: Text, check_headers: bool = False
+) -> None:
+    total_images = sum(project_stats["images"] for project_stats in stats)
+    total_size = sum(project_stats["size"] for project_stats in stats)
+
+    lines = [
+        f"<b>Dry run:</b> {len(stats)} projects, {total_images} images, "
+        f"{sizeof_fmt(total_size)} will be imported"
+    ]
+    for project_stats in stats:
+        lines.append(
+            f"• '{project_stats['project_name']}': {project_stats['datasets']} datasets, "
+            f"{project_stats['images']} images, {sizeof_fmt(project_stats['size'])}"
+        )
+    if len(skipped) > 0:
+        lines.append(f"<b>Skipped:</b> {len(skipped)}")
+        for item in skipped:
+            lines.append(f"• {item['reason']}")
+    if len(stats) > 0:
+        history = load_import_history()
+        estimates = []
+        for mode in ["copy", "link"]:
+            mode_check_headers = mode == "link" and check_headers
+            duration, is_default = predict_duration(
+                history, mode, total_images, total_size, mode_check_headers
+            )
+            mode_name = "link with image validation" if mode_check_headers else mode
+            estimate = f"{mode_name} ~ {format_duration(duration)}"
+            if is_default:
+                estimate += " (default throughput, no previous imports in this mode)"
+            estimates.append(estimate)
+        lines.append(f"<b>Estimated duration:</b> {', '.join(estimates)}")
+
+    output_message.set(text="<br>".join(lines), status="info" if len(stats) > 0 else "warning")
+    output_message.show()
+
+
+def get_projects_infos(workspace_id: int, project_ids: List[int]) -> List[ProjectInfo]:
+    """
+    Returns infos of the given projects in the same order, requested in batches by ID filter
+    instead of one request per project.
+    """
+    id_to_info = {}
+    for batch_ids in batched(project_ids):
+        filters = [{"field": ApiField.ID, "operator": "in", "value": batch_ids}]
+        for project_info in g.api.project.get_list(workspace_id, filters=filters):
+            id_to_info[project_info.id] = project_info
+    return [id_to_info[project_id] for project_id in project_ids if project_id in id_to_info]
+
+
 def show_result(
     dst_ws_name: str,
     dst_ws_id: int,
@@ -373,6 +837,7 @@ def show_result(
     result_preview_widgets: List[Flexbox],
     results_widgets: ReloadableArea,
     skipped_projects_count: int,
+    skipped_images_count: int = 0,
 ) -> None:
     if len(result_projects_ids) == 0:
         output_message.set(
@@ -386,31 +851,26 @@ def show_result(
 
     if len(result_projects_ids) > 0:
         output_project_text = "project" if len(result_projects_ids) == 1 else "projects"
-        if skipped_projects_count == 0:
-            output_message.set(
-                text=(
-                    f"{len(result_projects_ids)} {output_project_text} have "
-                    f"been imported to workspace: '{dst_ws_name}' ID: '{dst_ws_id}'"
-                ),
-                status="success",
-            )
+        text = (
+            f"{len(result_projects_ids)} {output_project_text} have "
+            f"been imported to workspace: '{dst_ws_name}' ID: '{dst_ws_id}'"
+        )
+        if skipped_projects_count > 0:
+            text += f". {skipped_projects_count} {output_project_text} have been skipped"
+        if skipped_images_count > 0:
+            text += f". {skipped_images_count} corrupted images have been skipped"
+        if skipped_projects_count == 0 and skipped_images_count == 0:
+            output_message.set(text=text, status="success")
         else:
-            output_message.set(
-                text=(
-                    f"{len(result_projects_ids)} {output_project_text} have "
-                    f"been imported to workspace: '{dst_ws_name}' ID: '{dst_ws_id}'. "
-                    f"{skipped_projects_count} {output_project_text} have been skipped. Check logs for more information."
-                ),
-                status="warning",
-            )
+            output_message.set(text=f"{text}. Check logs for more information.", status="warning")
 
         result_preview_widgets.append(
             Flexbox(
                 widgets=[
                     Text("Projects: "),
                     *[
-                        ProjectThumbnail(g.api.project.get_info_by_id(project_id))
-                        for project_id in result_projects_ids
+                        ProjectThumbnail(project_info)
+                        for project_info in get_projects_infos(dst_ws_id, result_projects_ids)
                     ],
                 ]
             )